@@ -49,12 +49,43 @@ Module documentation
 
 """
 
+import functools
 import logging
-import re
+import string
+import sys
 
 
 logger = logging.getLogger(__name__)
 
+_AND_SEPARATOR = " and "
+
+# Only ASCII case matters for the "and" separator, and unlike str.lower,
+# an ASCII-only fold is guaranteed to preserve string length, keeping the
+# positions found on the folded copy valid in the original value.
+_ASCII_LOWER = str.maketrans(
+    string.ascii_uppercase, string.ascii_lowercase
+)
+
+_INTERNED_FIELDS = frozenset(
+    ("journal", "publisher", "address", "edition", "year")
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def _split_names(value):
+    # Author strings repeat across the papers of a prolific author, hence
+    # the result of splitting a given value is memoized.
+    folded = value.translate(_ASCII_LOWER)
+    names = []
+    start = 0
+    while True:
+        position = folded.find(_AND_SEPARATOR, start)
+        if position < 0:
+            names.append(value[start:].strip())
+            return tuple(names)
+        names.append(value[start:position].strip())
+        start = position + len(_AND_SEPARATOR)
+
 
 class Entry:
     """
@@ -104,12 +135,42 @@ class Entry:
 
     """
 
+    __slots__ = ("type", "key", "_fields", "record")
+
     def __init__(self):
         self.type = ""
         self.key = ""
-        self.fields = None
+        self._fields = None
         self.record = ""
 
+    @property
+    def fields(self):
+        """
+        Key-value store of all the fields of a BibTeX entry.
+
+        The fields are parsed from the record on first access, making
+        reading large bibliographies cheap when only a few entries are
+        ever looked at in detail.
+
+        Returns
+        -------
+        fields : :class:`dict`
+            Key-value store of all the fields of a BibTeX entry
+
+
+        .. versionchanged:: 0.3
+            Fields are parsed lazily on first access.
+
+        """
+        if self._fields is None and self.record:
+            self._parse_fields()
+            self._convert_author_editor()
+        return self._fields
+
+    @fields.setter
+    def fields(self, fields):
+        self._fields = fields
+
     def from_bib(self, bibtex_record=None):
         """
         Read BibTeX entry from string and parse the contents.
@@ -146,7 +207,9 @@ class Entry:
 
         All fields will be parsed and the :attr:`Entry.fields` dict populated
         accordingly. Here, it does not matter whether values are surrounded by
-        ``{`` or ``"`` and whether they have a trailing comma.
+        ``{`` or ``"`` and whether they have a trailing comma. Values may
+        even span multiple lines, with any additional whitespace condensed
+        to single spaces.
 
         Authors and editors are split at the (case-insensitive) "AND" and
         stored as a list of strings.
@@ -157,31 +220,105 @@ class Entry:
         bibtex_record : :class:`str`
             Multiline string containing a BibTeX record
 
+
+        .. versionchanged:: 0.3
+            Field values may span multiple lines, and fields are parsed
+            lazily upon first access to :attr:`fields`.
+
         """
         self.record = bibtex_record
+        self._fields = None
         self._parse_record()
-        self._convert_author_editor()
 
     def _parse_record(self):
-        self.type = re.search(r"@([A-Za-z]+){", self.record).group(1).lower()
-        self.key = re.search(r"@[A-Za-z]+{([^,]+),", self.record).group(1)
-        self.fields = {}
-        for line in self.record.split("\n")[1:]:
-            if "=" in line:
-                field, value = line.split("=", maxsplit=1)
-                value = re.match(
-                    r'^[{"]?(.+?)[}"]?,?$',
-                    value.strip(),
-                ).group(1)
-                self.fields[field.strip()] = value
+        at_sign = self.record.index("@")
+        header, _, _ = self.record[at_sign:].partition("\n")
+        brace = header.index("{")
+        comma = header.index(",", brace)
+        self.type = header[1:brace].lower()
+        self.key = header[brace + 1 : comma].strip()
+
+    def _parse_fields(self):
+        # Single pass over the record body, tracking brace depth and
+        # quoting, to correctly handle values spanning multiple lines and
+        # containing commas.
+        self._fields = {}
+        newline = self.record.find("\n", self.record.index("@"))
+        body = self.record[newline + 1 :] if newline >= 0 else ""
+        field_chars = []
+        value_chars = []
+        in_value = False
+        in_quotes = False
+        depth = 0
+        for character in body:
+            if not in_value:
+                if character == "=":
+                    in_value = True
+                else:
+                    field_chars.append(character)
+                continue
+            if in_quotes:
+                if character == '"':
+                    in_quotes = False
+                value_chars.append(character)
+                continue
+            if character == "{":
+                depth += 1
+            elif character == "}":
+                if not depth:
+                    continue
+                depth -= 1
+            elif (
+                character == '"'
+                and not depth
+                and all(char.isspace() for char in value_chars)
+            ):
+                # A quote only delimits a value at its very beginning;
+                # inside braces, quotes are ordinary characters.
+                in_quotes = True
+            elif character == "," and not depth:
+                self._set_field(field_chars, value_chars)
+                field_chars = []
+                value_chars = []
+                in_value = False
+                continue
+            value_chars.append(character)
+        if in_value:
+            self._set_field(field_chars, value_chars)
+
+    def _set_field(self, field_chars, value_chars):
+        field = "".join(field_chars).strip()
+        value = self._strip_delimiters("".join(value_chars))
+        if "\n" in value:
+            value = " ".join(value.split())
+        if field:
+            # Interning makes all entries of a bibliography share the same
+            # field name string objects, as BibTeX field names come from a
+            # small set repeated over and over again. The same holds for
+            # the values of a few fields, such as journal names, that recur
+            # across the entries of a bibliography.
+            field = sys.intern(field.lower())
+            if field in _INTERNED_FIELDS:
+                value = sys.intern(value)
+            self._fields[field] = value
+
+    @staticmethod
+    def _strip_delimiters(value):
+        value = value.strip()
+        if value.endswith(","):
+            value = value[:-1]
+        if value and value[0] in '{"':
+            value = value[1:]
+        if value and value[-1] in '}"':
+            value = value[:-1]
+        return value
 
     def _convert_author_editor(self):
-        for key in ["author", "editor"]:
-            if key in self.fields:
-                names = re.split(
-                    " and ", self.fields[key], flags=re.IGNORECASE
-                )
-                self.fields[key] = [name.strip() for name in names]
+        fields = self._fields
+        for key in ("author", "editor"):
+            value = fields.get(key)
+            if value is not None:
+                fields[key] = list(_split_names(value))
 
 
 class Bibliography:
@@ -226,6 +363,8 @@ class Bibliography:
 
     """
 
+    __slots__ = ("entries",)
+
     def __init__(self):
         self.entries = []
 
@@ -249,31 +388,88 @@ class Bibliography:
         ValueError
             Raised if no ``bibliography`` is provided
 
+
+        .. versionchanged:: 0.3
+            The bibliography is scanned in a single pass, with each entry a
+            direct slice of the input rather than a reassembled copy.
+
         """
         if not bibliography:
             raise ValueError
-        for block in bibliography.split("\n@"):
-            if block:
-                if not block.startswith("@"):
-                    block = f"@{block}"
-                entry = Entry()
-                entry.from_bib(block)
-                self.entries.append(entry)
+        start = bibliography.find("@")
+        if start > 0 and not bibliography[:start].isspace():
+            # Searching from one character before the at sign keeps an
+            # entry starting right at the end of the preamble.
+            start = bibliography.find("\n@", start - 1)
+            if start >= 0:
+                start += 1
+        while start >= 0:
+            end = bibliography.find("\n@", start + 1)
+            block = (
+                bibliography[start:]
+                if end < 0
+                else bibliography[start:end]
+            )
+            if len(block) > 1:
+                self._append_entry(block)
+            if end < 0:
+                break
+            start = end + 1
+
+    def from_stream(self, stream):
+        """
+        Read BibTeX bibliography from a stream of lines.
+
+        Entries are detected by a ``@`` sign at the beginning of a line and
+        converted into :obj:`Entry` objects one at a time. Hence, at no time
+        does the entire bibliography need to reside in memory, making this
+        method suitable for reading large BibTeX files.
+
+        Parameters
+        ----------
+        stream : iterable
+            Iterable yielding the lines of a BibTeX bibliography, *e.g.* a
+            file object or :obj:`io.StringIO` object
+
+
+        .. versionadded:: 0.3
+
+        """
+        current_lines = []
+        for line in stream:
+            if line.startswith("@") and current_lines:
+                self._append_entry("".join(current_lines))
+                current_lines = []
+            if current_lines or line.startswith("@"):
+                current_lines.append(line)
+        if current_lines:
+            self._append_entry("".join(current_lines))
+
+    def _append_entry(self, record):
+        entry = Entry()
+        entry.from_bib(record)
+        self.entries.append(entry)
 
     def from_file(self, filename=""):
         """
         Read BibTeX bibliography and convert it into individual entries.
 
-        For details of how the file contents are parsed, see :meth:`from_bib`.
+        The file is read line by line and entries are converted as soon as
+        they are complete, rather than reading the entire file into memory
+        first. For details of how the contents are parsed,
+        see :meth:`from_stream`.
 
         Parameters
         ----------
         filename : :class:`str`
             Name of the BibTeX file to read bibliography from
 
+
+        .. versionchanged:: 0.3
+            File contents are streamed instead of read into memory at once.
+
         """
         if not filename:
             raise ValueError
         with open(filename, "r", encoding="utf8") as file:
-            bibliography = file.read()
-        self.from_bib(bibliography)
+            self.from_stream(file)
@@ -45,9 +45,9 @@ Module documentation
 
 """
 
-import inspect
 import logging
 
+import bibrecord.bibtex
 import bibrecord.record
 
 
@@ -100,6 +100,8 @@ class Database:
 
     """
 
+    __slots__ = ("records",)
+
     def __init__(self):
         self.records = {}
 
@@ -119,20 +121,55 @@ class Database:
             Representation of a BibTeX bibliography, *e.g.* as read from a
             file.
 
+
+        .. versionchanged:: 0.3
+            Entries with duplicate keys are skipped (and a warning logged)
+            rather than aborting the processing of all remaining entries.
+
         """
         if not bibliography:
             raise ValueError
-        record_types = {}
-        for item in inspect.getmembers(bibrecord.record, inspect.isclass):
-            record_types[item[0]] = item[1]
+        record_types = bibrecord.record.RECORD_TYPES
+        warn = logger.warning
         for entry in bibliography.entries:
-            record_type = entry.type.capitalize()
-            if record_type in record_types:
-                if entry.key in self.records:
-                    logger.warning("Duplicate key %s", entry.key)
-                    break
-                record = record_types[record_type]()
-                record.from_bib(entry.record)
-                self.records[entry.key] = record
-            else:
-                logger.warning("Unknown record type %s", record_type)
+            record_class = record_types.get(entry.type)
+            if record_class is None:
+                warn("Unknown record type %s", entry.type)
+                continue
+            if entry.key in self.records:
+                warn("Duplicate key %s", entry.key)
+                continue
+            record = record_class()
+            record.from_entry(entry)
+            self.records[entry.key] = record
+
+    def from_files(self, filenames):
+        """
+        Populate database from a series of BibTeX files.
+
+        Bibliographies spread over several BibTeX files are a common
+        setup. This method reads all given files and merges their entries
+        into the database in one go, with duplicate keys across files
+        skipped (and a warning logged) just as within a single
+        bibliography.
+
+        Parameters
+        ----------
+        filenames : :class:`list`
+            Names of the BibTeX files to read bibliographic records from
+
+        Raises
+        ------
+        ValueError
+            Raised if no ``filenames`` are provided
+
+
+        .. versionadded:: 0.3
+
+        """
+        if not filenames:
+            raise ValueError
+        bibliography = bibrecord.bibtex.Bibliography()
+        for filename in filenames:
+            bibliography.from_file(filename)
+        self.from_bibliography(bibliography)
@@ -76,9 +76,6 @@ mentioning:
   setting, namely storing bibliographic records within a class implementing
   an algorithm in a somewhat structured and natural way.
 
-* Each type needs to implement a non-public attribute :attr:`_type` that is
-  set to ``__class__.__name__``.
-
 * The constructor needs to call the constructor of the super class,
   by using ``super().__init__(key=key)``. Note that here, the key is passed.
   Hence, add the key property explicitly to your class constructor as well.
@@ -97,7 +94,6 @@ stripped-down example of the :class:`Book` class):
         self.publisher = publisher
         self.year = year
         self.format = 'author: title. publisher, year.'
-        self._type = __class__.__name__
 
 Please note that author (and editor) fields are always lists. Hence,
 the default is not the empty list (as this is mutable), but ``None``.
@@ -110,13 +106,144 @@ Module documentation
 
 """
 
+import functools
 import logging
-import re
 
 from bibrecord import bibtex
 
 logger = logging.getLogger(__name__)
 
+_EXCLUDED_PROPERTIES = frozenset(("reverse", "key", "format"))
+
+_PERSON_FIELDS = frozenset(("author", "editor"))
+
+
+def _is_boundary(character):
+    return not (character.isalnum() or character == "_")
+
+
+@functools.lru_cache(maxsize=256)
+def _tokenize_format(format_string, properties):
+    # Pre-parse a format string into literal and field tokens, so that
+    # rendering a record becomes a single join over the token list. As both
+    # format strings and property sets are class-specific for all practical
+    # purposes, the token lists are shared across instances.
+    #
+    # Property names are matched only at word boundaries, longest name
+    # first, using plain string scanning.
+    names = sorted(properties, key=len, reverse=True)
+    tokens = []
+    position = 0
+    length = len(format_string)
+    while position < length:
+        match_start = length
+        match_name = ""
+        for name in names:
+            found = format_string.find(name, position)
+            while 0 <= found < match_start:
+                end = found + len(name)
+                if (
+                    found == 0 or _is_boundary(format_string[found - 1])
+                ) and (
+                    end == length or _is_boundary(format_string[end])
+                ):
+                    match_start = found
+                    match_name = name
+                    break
+                found = format_string.find(name, found + 1)
+        if not match_name:
+            tokens.append((False, format_string[position:]))
+            break
+        if match_start > position:
+            tokens.append((False, format_string[position:match_start]))
+        tokens.append((True, match_name))
+        position = match_start + len(match_name)
+    return tokens
+
+
+def _name_to_string(first, last, particle, suffix, reverse=False):
+    if particle:
+        last = particle + " " + last
+    if suffix:
+        last = last + ", " + suffix
+    if reverse:
+        return last + ", " + first
+    return first + " " + last
+
+
+def _name_to_bib(first, last, particle, suffix, reverse=False):
+    return _name_to_string(
+        first, last, particle, suffix, reverse=reverse or particle or suffix
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_person(string, reverse, bib):
+    # Rendering a name is deterministic in these three arguments, and the
+    # same authors recur across the records of a bibliography, hence the
+    # formatted names are memoized. No Person object is involved at all.
+    parts = _parse_name(string)
+    if bib:
+        return _name_to_bib(*parts, reverse=reverse)
+    return _name_to_string(*parts, reverse=reverse)
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_entry(bibtex_record):
+    # Long-running processes tend to re-read the same BibTeX records over
+    # and over again; the parsed entries for the most recent records are
+    # therefore cached.
+    entry = bibtex.Entry()
+    entry.from_bib(bibtex_record)
+    return entry
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_name(string):
+    # Identical name strings recur across the records of a bibliography,
+    # hence the parsed parts are memoized per raw string.
+    if "," not in string and "  " not in string and string == string.strip():
+        # Fast path for the most common form, "FIRST LAST", skipping both
+        # whitespace normalisation and comma handling.
+        first, last = string.rsplit(" ", maxsplit=1)
+        return first, last, "", ""
+    string = " ".join(string.split())
+    comma1 = string.find(",")
+    if comma1 < 0:
+        first, last = string.rsplit(" ", maxsplit=1)
+        return first, last, "", ""
+    suffix = ""
+    comma2 = string.find(",", comma1 + 1)
+    if comma2 >= 0:
+        suffix = string[comma1 + 1 : comma2].strip()
+        rest = string[comma2 + 1 :]
+    else:
+        rest = string[comma1 + 1 :]
+    comma3 = rest.find(",")
+    first = rest[:comma3].strip() if comma3 >= 0 else rest.strip()
+    head = string[:comma1].strip()
+    space = head.rfind(" ")
+    if space >= 0:
+        particle = head[:space]
+        last = head[space + 1 :]
+    else:
+        particle = ""
+        last = head
+    return first, last, particle, suffix
+
+
+RECORD_TYPES = {}
+"""
+Registry of all types of bibliographic records available.
+
+The keys are the (lowercase) BibTeX entry types, the values the
+corresponding subclasses of :class:`Record`. Subclasses are registered
+automatically upon their definition. The registry is used, *i.a.*, by the
+:class:`bibrecord.database.Database` class to map BibTeX entries to records.
+
+.. versionadded:: 0.3
+"""
+
 
 class Record:
     """
@@ -150,12 +277,21 @@ class Record:
 
     """
 
+    _type = "Record"
+    _bib_prefix = "@Record{"
+
     def __init__(self, key=""):
         self.key = key
         self.format = ""
         self.reverse = False
-        self._type = __class__.__name__
-        self._exclude = ["reverse", "key", "format"]
+        self._exclude = _EXCLUDED_PROPERTIES
+        self._property_cache = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._type = cls.__name__
+        cls._bib_prefix = "@" + cls.__name__ + "{"
+        RECORD_TYPES[cls.__name__.lower()] = cls
 
     def to_string(self):
         """
@@ -184,16 +320,33 @@ class Record:
             String representation of a bibliography record
 
         """
-        output = self.format
-        for prop in self._get_public_properties():
-            value = getattr(self, prop)
-            if prop in ["author", "editor"]:
-                value = ", ".join([self._person_to_string(x) for x in value])
-            if prop in ["doi"]:
-                if value:
-                    value = f"doi:{value}"
-            output = output.replace(prop, value)
-        return output
+        return self._render_string(self.format)
+
+    def _render_string(self, format_string):
+        properties = self._get_public_properties()
+        if not format_string or not properties:
+            return format_string
+        tokens = _tokenize_format(format_string, tuple(properties))
+        if not any(is_field for is_field, _ in tokens):
+            # Fast path for format strings without any placeholders,
+            # skipping value rendering entirely.
+            return format_string
+        # Snapshotting the instance dict once replaces one attribute
+        # lookup per field token with a plain dict lookup.
+        attributes = vars(self)
+        return "".join(
+            self._property_to_string(text, attributes[text])
+            if is_field
+            else text
+            for is_field, text in tokens
+        )
+
+    def _property_to_string(self, prop, value):
+        if prop in _PERSON_FIELDS:
+            return ", ".join(self._person_to_string(x) for x in value)
+        if prop == "doi" and value:
+            return f"doi:{value}"
+        return value
 
     def to_bib(self):
         """
@@ -230,18 +383,22 @@ class Record:
             BibTeX representation of a bibliography record
 
         """
-        items = []
+        parts = [self._bib_prefix, self.key, ",\n"]
+        separator = ""
         for prop in self._get_public_properties():
-            if getattr(self, prop):
-                value = getattr(self, prop)
-                if prop in ["author", "editor"]:
-                    value = " AND ".join(
-                        [self._person_to_string(x, bib=True) for x in value]
-                    )
-                items.append(f"\t{prop} = {{{value}}}")
-        string_items = ",\n".join(items)
-        output = f"@{self._type}{{{self.key},\n{string_items}\n}}"
-        return output
+            value = getattr(self, prop)
+            if not value:
+                continue
+            if prop in _PERSON_FIELDS:
+                value = " AND ".join(
+                    self._person_to_string(x, bib=True) for x in value
+                )
+            # str() keeps non-string values, such as years given as int,
+            # rendering as they did with f-string formatting.
+            parts.extend((separator, "\t", prop, " = {", str(value), "}"))
+            separator = ",\n"
+        parts.append("\n}")
+        return "".join(parts)
 
     def from_bib(self, bibtex_record=None):
         """
@@ -264,31 +421,62 @@ class Record:
         .. versionadded:: 0.2
 
         """
-        entry = bibtex.Entry()
-        entry.from_bib(bibtex_record)
+        self.from_entry(_parse_entry(bibtex_record))
+
+    def from_entry(self, entry):
+        """
+        Set attributes of a bibliographic record from a parsed BibTeX entry.
+
+        In contrast to :meth:`from_bib`, this method operates on an already
+        parsed entry, *e.g.* as contained in a
+        :obj:`bibrecord.bibtex.Bibliography` object, and hence does not need
+        to parse the BibTeX record again.
+
+        Parameters
+        ----------
+        entry : :class:`bibrecord.bibtex.Entry`
+            Representation of a BibTeX entry
+
+        Raises
+        ------
+        ValueError
+            Raised if the entry type does not match the record type
+
+
+        .. versionadded:: 0.3
+
+        """
         if entry.type != self._type.lower():
             raise ValueError()
         self.key = entry.key
+        # Known attributes all live in the instance dict, hence membership
+        # in vars() replaces the full descriptor walk of hasattr.
+        attributes = vars(self)
         for key, value in entry.fields.items():
-            if hasattr(self, key):
+            if key in attributes:
+                if isinstance(value, list):
+                    # Records own their author/editor lists, hence entries
+                    # (potentially cached and shared) keep their own copy.
+                    value = list(value)
                 setattr(self, key, value)
 
     def _get_public_properties(self):
-        properties = []
-        for prop in list(self.__dict__.keys()):
-            if not str(prop).startswith("_") and prop not in self._exclude:
-                properties.append(prop)
-        return properties
+        # The result is computed lazily on first use and cached. The length
+        # of the instance dict serves as cheap invalidation in case public
+        # attributes get added after the first rendering.
+        cache = self._property_cache
+        if cache is None or cache[0] != len(self.__dict__):
+            properties = [
+                prop
+                for prop in self.__dict__
+                if not prop.startswith("_") and prop not in self._exclude
+            ]
+            cache = (len(self.__dict__), properties)
+            self._property_cache = cache
+        return cache[1]
 
     def _person_to_string(self, string, bib=False):
-        person = Person()
-        person.reverse = self.reverse
-        person.from_bib(string)
-        if bib:
-            output = person.to_bib()
-        else:
-            output = person.to_string()
-        return output
+        return _format_person(string, self.reverse, bib)
 
 
 class Person:
@@ -351,6 +539,8 @@ class Person:
 
     """
 
+    __slots__ = ("first", "last", "particle", "suffix", "reverse")
+
     def __init__(self, first="", last="", particle="", suffix=""):
         self.first = first
         self.last = last
@@ -381,19 +571,9 @@ class Person:
             String containing person's name
 
         """
-        # Reduce additional whitespace
-        string = re.sub(r"\s{2,}", r" ", string.strip())
-        parts = string.split(",")
-        if len(parts) > 2:
-            self.suffix = parts.pop(1).strip()
-        if len(parts) > 1:
-            self.first = parts[1].strip()
-            last_parts = parts[0].strip().rsplit(" ", maxsplit=1)
-            if len(last_parts) > 1:
-                self.particle = last_parts.pop(0)
-            self.last = last_parts[0]
-        else:
-            self.first, self.last = string.rsplit(" ", maxsplit=1)
+        self.first, self.last, self.particle, self.suffix = _parse_name(
+            string
+        )
 
     def to_string(self):
         """
@@ -413,16 +593,13 @@ class Person:
             String representation of a person's name
 
         """
-        last = self.last
-        if self.particle:
-            last = f"{self.particle} {self.last}"
-        if self.suffix:
-            last = f"{last}, {self.suffix}"
-        if self.reverse:
-            output = f"{last}, {self.first}"
-        else:
-            output = f"{self.first} {last}"
-        return output
+        return _name_to_string(
+            self.first,
+            self.last,
+            self.particle,
+            self.suffix,
+            reverse=self.reverse,
+        )
 
     def to_bib(self):
         """
@@ -438,12 +615,67 @@ class Person:
             BibTeX-compatible string representation of a person's name
 
         """
-        original_reverse_property = self.reverse
-        if self.particle or self.suffix:
-            self.reverse = True
-        output = self.to_string()
-        self.reverse = original_reverse_property
-        return output
+        return _name_to_bib(
+            self.first,
+            self.last,
+            self.particle,
+            self.suffix,
+            reverse=self.reverse,
+        )
+
+
+def records_to_string(records):
+    """
+    Return string representation of a series of bibliographic records.
+
+    Rendering a bibliography record by record via :meth:`Record.to_string`
+    repeats a certain amount of per-call work. This function renders all
+    records in one go, with format tokenisation, property enumeration, and
+    name parsing amortized over the entire batch thanks to the caches
+    employed, and joins the individual representations by line breaks.
+
+    Parameters
+    ----------
+    records : :class:`list`
+        Bibliographic records, each of type :class:`Record`
+
+    Returns
+    -------
+    output : :class:`str`
+        String representations of the records, one record per line
+
+
+    .. versionadded:: 0.3
+
+    """
+    return "\n".join(record.to_string() for record in records)
+
+
+def records_to_bib(records):
+    """
+    Return BibTeX representation of a series of bibliographic records.
+
+    This function renders all records in one go via
+    :meth:`Record.to_bib`, with property enumeration and name parsing
+    amortized over the entire batch thanks to the caches employed,
+    and joins the individual BibTeX records by blank lines, ready to be
+    written to a BibTeX file.
+
+    Parameters
+    ----------
+    records : :class:`list`
+        Bibliographic records, each of type :class:`Record`
+
+    Returns
+    -------
+    output : :class:`str`
+        BibTeX representations of the records, separated by blank lines
+
+
+    .. versionadded:: 0.3
+
+    """
+    return "\n\n".join(record.to_bib() for record in records)
 
 
 class Article(Record):
@@ -589,7 +821,6 @@ class Article(Record):
         self.pages = pages
         self.doi = doi
         self.format = "author: title. journal volume:pages, year. doi"
-        self._type = __class__.__name__
 
 
 class Book(Record):
@@ -765,7 +996,6 @@ class Book(Record):
         self.address = address
         self.edition = edition
         self.format = "author: title. publisher, address year."
-        self._type = __class__.__name__
 
     def to_string(self):
         """
@@ -789,9 +1019,10 @@ class Book(Record):
             String representation of a bibliography record
 
         """
+        format_string = self.format
         if self.editor:
-            self.format = self.format.replace("author", "editor (Ed.)")
-        return super().to_string()
+            format_string = format_string.replace("author", "editor (Ed.)")
+        return self._render_string(format_string)
 
 
 class Dataset(Record):
@@ -944,7 +1175,6 @@ class Dataset(Record):
         self.doi = doi
         self.url = url
         self.format = "author: title (version). publisher, doi, year."
-        self._type = __class__.__name__
 
     def to_string(self):
         """
@@ -968,6 +1198,7 @@ class Dataset(Record):
             String representation of a bibliography record
 
         """
+        format_string = self.format
         if self.editor:
-            self.format = self.format.replace("author", "editor (Ed.)")
-        return super().to_string()
+            format_string = format_string.replace("author", "editor (Ed.)")
+        return self._render_string(format_string)
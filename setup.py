@@ -3,7 +3,10 @@ import setuptools
 
 
 def read(filename):
-    with open(os.path.join(os.path.dirname(__file__), filename)) as file:
+    with open(
+        os.path.join(os.path.dirname(__file__), filename),
+        encoding="utf8",
+    ) as file:
         content = file.read()
     return content
 
@@ -38,6 +41,8 @@ setuptools.setup(
         "Programming Language :: Python :: 3.10",
         "Programming Language :: Python :: 3.11",
         "Programming Language :: Python :: 3.12",
+        "Programming Language :: Python :: Implementation :: CPython",
+        "Programming Language :: Python :: Implementation :: PyPy",
         "License :: OSI Approved :: BSD License",
         "Operating System :: OS Independent",
         "Intended Audience :: Science/Research",
@@ -1,3 +1,4 @@
+import io
 import os
 import unittest
 
@@ -68,6 +69,12 @@ class TestEntry(unittest.TestCase):
         self.entry.from_bib(self.book_entry)
         self.assertTrue(self.entry.fields)
 
+    def test_from_bib_parses_fields_only_on_access(self):
+        self.entry.from_bib(self.book_entry)
+        self.assertIsNone(self.entry._fields)
+        self.assertTrue(self.entry.fields)
+        self.assertIsNotNone(self.entry._fields)
+
     def test_from_bib_sets_author_as_list(self):
         self.entry.from_bib(self.article_entry)
         self.assertIsInstance(self.entry.fields["author"], list)
@@ -82,6 +89,25 @@ class TestEntry(unittest.TestCase):
         )
         self.assertEqual("Lorem = ipsum", self.entry.fields["title"])
 
+    def test_from_bib_with_multiline_field_value(self):
+        self.entry.from_bib(
+            ARTICLE.replace("{Lorem ipsum}", "{Lorem\n        ipsum}")
+        )
+        self.assertEqual("Lorem ipsum", self.entry.fields["title"])
+
+    def test_from_bib_with_comma_in_field_value(self):
+        self.entry.from_bib(
+            ARTICLE.replace("{Lorem ipsum}", "{Lorem, ipsum}")
+        )
+        self.assertEqual("Lorem, ipsum", self.entry.fields["title"])
+
+    def test_from_bib_with_quote_in_braced_field_value(self):
+        self.entry.from_bib(
+            ARTICLE.replace("{Lorem ipsum}", '{The 5" disk}')
+        )
+        self.assertEqual('The 5" disk', self.entry.fields["title"])
+        self.assertEqual("2024", self.entry.fields["year"])
+
     def test_from_bib_does_not_omit_first_field(self):
         self.entry.from_bib(ARTICLE.strip())
         self.assertTrue(self.entry.fields["author"])
@@ -96,6 +122,20 @@ class TestEntry(unittest.TestCase):
             ["John Doe", "Anna Andrle"], self.entry.fields["author"]
         )
 
+    def test_from_bib_with_author_name_with_length_changing_case_fold(
+        self,
+    ):
+        # "İ".lower() yields two characters; splitting must not rely on
+        # positions computed on a case-folded copy of different length.
+        self.entry.from_bib(
+            ARTICLE.replace(
+                "{John Doe and Jane Doe}", "{İpek Şahin and John Doe}"
+            )
+        )
+        self.assertListEqual(
+            ["İpek Şahin", "John Doe"], self.entry.fields["author"]
+        )
+
 
 class TestBibliography(unittest.TestCase):
     def setUp(self):
@@ -126,6 +166,21 @@ class TestBibliography(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.bibliography.from_bib("")
 
+    def test_from_bib_with_preamble_keeps_first_entry(self):
+        self.bibliography.from_bib("Some comment" + self.bibtex)
+        self.assertEqual(
+            ["doe-foo-1-1", "doe-j-2024"],
+            [entry.key for entry in self.bibliography.entries],
+        )
+
+    def test_from_stream_populates_entries(self):
+        self.bibliography.from_stream(io.StringIO(self.bibtex))
+        self.assertTrue(self.bibliography.entries)
+
+    def test_from_stream_adds_entries_to_entries(self):
+        self.bibliography.from_stream(io.StringIO(self.bibtex))
+        self.assertIsInstance(self.bibliography.entries[0], bibtex.Entry)
+
     def test_from_file_adds_entries_to_entries(self):
         self.create_bibtex_file()
         self.bibliography.from_file(self.filename)
@@ -1,3 +1,4 @@
+import os
 import unittest
 
 from bibrecord import bibtex, database, record
@@ -62,7 +63,7 @@ class TestDatabase(unittest.TestCase):
 
     def test_from_bibliography_with_duplicates_does_not_overwrite(self):
         self.database.from_bibliography(self.bibliography)
-        self.bibliography.entries[0].title = "Unknown"
+        self.bibliography.entries[0].fields["title"] = "Unknown"
         with self.assertLogs(__package__, level="WARNING") as cm:
             self.database.from_bibliography(self.bibliography)
         self.assertEqual(
@@ -75,3 +76,28 @@ class TestDatabase(unittest.TestCase):
         with self.assertLogs(__package__, level="WARNING") as cm:
             self.database.from_bibliography(bibliography)
         self.assertIn("Unknown record type", cm.output[0])
+
+
+class TestDatabaseFromFiles(unittest.TestCase):
+    def setUp(self):
+        self.database = database.Database()
+        self.filenames = ["test1.bib", "test2.bib"]
+
+    def tearDown(self):
+        for filename in self.filenames:
+            if os.path.exists(filename):
+                os.remove(filename)
+
+    def create_bibtex_files(self):
+        for filename, contents in zip(self.filenames, [ARTICLE, BOOK]):
+            with open(filename, "w+", encoding="utf8") as file:
+                file.write(contents)
+
+    def test_from_files_populates_records(self):
+        self.create_bibtex_files()
+        self.database.from_files(self.filenames)
+        self.assertEqual(2, len(self.database.records))
+
+    def test_from_files_without_filenames_raises(self):
+        with self.assertRaises(ValueError):
+            self.database.from_files([])
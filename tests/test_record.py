@@ -1,6 +1,6 @@
 import unittest
 
-from bibrecord import record
+from bibrecord import bibtex, record
 
 
 # Dummy entry for testing the Record class
@@ -39,6 +39,62 @@ BOOK = """
 """
 
 
+class TestRecordTypes(unittest.TestCase):
+
+    def test_record_types_contains_record_subclasses(self):
+        for type_ in ["article", "book", "dataset"]:
+            self.assertIn(type_, record.RECORD_TYPES)
+
+    def test_record_types_maps_types_to_classes(self):
+        self.assertIs(record.Article, record.RECORD_TYPES["article"])
+
+
+class TestRecordsToString(unittest.TestCase):
+
+    def setUp(self):
+        self.records = [
+            record.Article(
+                author=["John Doe"], title="Lorem ipsum", journal="Foo"
+            ),
+            record.Article(
+                author=["Jane Doe"], title="Dolor sit amet", journal="Bar"
+            ),
+        ]
+
+    def test_records_to_string_returns_string(self):
+        self.assertIsInstance(record.records_to_string(self.records), str)
+
+    def test_records_to_string_joins_individual_records_with_linebreaks(
+        self,
+    ):
+        output = "\n".join(
+            record_.to_string() for record_ in self.records
+        )
+        self.assertEqual(output, record.records_to_string(self.records))
+
+
+class TestRecordsToBib(unittest.TestCase):
+
+    def setUp(self):
+        self.records = [
+            record.Article(
+                author=["John Doe"], title="Lorem ipsum", journal="Foo"
+            ),
+            record.Article(
+                author=["Jane Doe"], title="Dolor sit amet", journal="Bar"
+            ),
+        ]
+
+    def test_records_to_bib_returns_string(self):
+        self.assertIsInstance(record.records_to_bib(self.records), str)
+
+    def test_records_to_bib_joins_individual_records_with_blank_lines(self):
+        output = "\n\n".join(
+            record_.to_bib() for record_ in self.records
+        )
+        self.assertEqual(output, record.records_to_bib(self.records))
+
+
 class TestRecord(unittest.TestCase):
 
     def setUp(self):
@@ -137,6 +193,11 @@ class TestRecord(unittest.TestCase):
         )
         self.assertEqual(self.record.to_bib(), output)
 
+    def test_to_bib_with_non_string_property_converts_to_string(self):
+        self.record.year = 2024
+        output = "@Record{,\n\tyear = {2024}\n}"
+        self.assertEqual(self.record.to_bib(), output)
+
     def test_to_bib_with_author_reversed_adds_author_to_bibtex_record(self):
         self.record.author = ["John Doe"]
         self.record.reverse = True
@@ -170,6 +231,25 @@ class TestRecord(unittest.TestCase):
         self.record.from_bib(RECORD)
         self.assertFalse(hasattr(self.record, "title"))
 
+    def test_from_entry_sets_key(self):
+        entry = bibtex.Entry()
+        entry.from_bib(RECORD)
+        self.record.from_entry(entry)
+        self.assertEqual("doe-j-2024", self.record.key)
+
+    def test_from_entry_sets_attributes(self):
+        entry = bibtex.Entry()
+        entry.from_bib(RECORD)
+        self.record.title = ""
+        self.record.from_entry(entry)
+        self.assertEqual("Lorem ipsum", self.record.title)
+
+    def test_from_entry_with_wrong_entry_type_raises(self):
+        entry = bibtex.Entry()
+        entry.from_bib(ARTICLE)
+        with self.assertRaises(ValueError):
+            self.record.from_entry(entry)
+
 
 class TestPerson(unittest.TestCase):
 
@@ -464,6 +544,18 @@ class TestBook(unittest.TestCase):
         )
         self.assertEqual(output, book.to_string())
 
+    def test_with_editor_to_string_does_not_change_format(self):
+        book = record.Book(
+            editor=self.author,
+            title=self.title,
+            publisher=self.publisher,
+            year=self.year,
+            address=self.address,
+        )
+        format_ = book.format
+        book.to_string()
+        self.assertEqual(format_, book.format)
+
     def test_to_bib_returns_bibtex_record_with_correct_type(self):
         output = "@Book{,\n\n}"
         self.assertEqual(self.book.to_bib(), output)